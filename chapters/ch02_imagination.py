@@ -1,5 +1,12 @@
 # chapters/ch02_imagination.py
 from core.agent import Agent
+from core.memory import memory_preview, _timestamp_seconds
+from chapters._prompts import (
+    SIMPLE_IMAGINATION_PROMPT,
+    SIMPLE_IMAGINATION_SYSTEM,
+    COMPOUND_IMAGINATION_PROMPT,
+    COMPOUND_IMAGINATION_SYSTEM,
+)
 
 
 class SimpleImaginationAgent(Agent):
@@ -7,6 +14,8 @@ class SimpleImaginationAgent(Agent):
     Implements Hobbes' concept of simple imagination.
     "...simple imagination, as when one imagineth a man, or horse, which he hath seen before."
     """
+
+    MAX_TOKENS = 256
     
     def __init__(self, name, llm_client, memory_manager):
         # Configure memory for simple imagination with decay-focused summary
@@ -30,50 +39,49 @@ class SimpleImaginationAgent(Agent):
         """
         Process sense data into simple imagination - the decaying sense that persists
         after the sensory stimulus is gone
-        """
 
-        # Retrieve recent sense impressions with summaries to simulate "memory"
-        recent_senses = await self.memory.get_bucket_with_summaries("sense_impressions")
-
-        prompt = f"""
-        You are emulating simple imagination as described by Thomas Hobbes in Leviathan.
-        
-        Hobbes defines imagination with a metaphor to motions caused by our sense impression of objects: "so also it happeneth in that motion which is made in the internal parts of a man, then, when he sees, dreams, etc. For after the object is removed, or the eye shut, we still retain an image of the thing seen, though more obscure than when we see it. And this is it the Latins call imagination, from the image made in seeing, and apply the same, though improperly, to all the other senses. But the Greeks call it fancy, which signifies appearance, and is as proper to one sense as to another. Imagination, therefore, is nothing but decaying sense; and is found in men and many other living creatures, as well sleeping as waking." 
-        
-        Simple imagination is recalling something as it was perceived before.
-        
-        Current sense impressions:
-        {sense_data}
-        
-        Previous sense impressions (if any):
-        {self._format_memories(recent_senses)}
-        
-        Based on this current sense impression, simulate how it would persist in the mind as a 
-        "decaying sense" as Hobbes put it, "This decaying sense, when we would express the thing itself (I mean fancy itself), we call imagination, as I said before. But when we would express the decay, and signify that the sense is fading, old, and past, it is called memory. So that imagination and memory are but one thing, which for diverse considerations hath diverse names." - how it would be remembered shortly after being experienced. 
-        
-        Focus on:
-        1. What aspects would remain strongest in memory
-        2. What might begin to fade or become less distinct
-        3. How the core meaning would be preserved even as details decay
-        
-        Remember that according to Hobbes, "the longer the time is, after the sight or sense of any 
-        object, the weaker is the imagination."
+        sense_data may be a string or an async iterator of chunks from a
+        streaming sense stage.
         """
+        chunks = []
+        async for chunk in self.process_stream(sense_data, original_input=original_input):
+            chunks.append(chunk)
+        return "".join(chunks)
+
+    async def process_stream(self, sense_data, original_input=None):
+        """Streaming variant of process: yields imagination text as it is
+        generated, so the compound stage can start on the first tokens
+        instead of waiting out the full decode; the complete text is stored
+        in memory once the stream ends"""
+
+        sense_data = await self._collect_input(sense_data)
+
+        # Recent sense impressions (with their latest summary) come from the
+        # memoized memory pack: the rendered block is byte-identical until
+        # the bucket changes, so repeated calls over an unchanged bucket
+        # keep the provider's prompt-prefix cache warm
+        memories, _ = await self.memory.get_memory_pack("sense_impressions")
+
+        prompt = SIMPLE_IMAGINATION_PROMPT.substitute(
+            sense_data=sense_data,
+            memories=memories or "None",
+        )
 
-        imagination = await self.llm.generate(prompt, temperature=0.7)
+        chunks = []
+        async for chunk in self.llm.generate_stream(
+            prompt,
+            temperature=0.7,
+            max_tokens=self.MAX_TOKENS,
+            system_message=SIMPLE_IMAGINATION_SYSTEM,
+        ):
+            chunks.append(chunk)
+            yield chunk
 
         # Store in memory
         await self.memory.add_memory(
-            imagination, "simple_imagination", {"original_input": original_input}
+            "".join(chunks), "simple_imagination", {"original_input": original_input}
         )
 
-        return imagination
-
-    def _format_memories(self, memories):
-        if not memories:
-            return "None"
-        return "\n".join([f"- {m['content'][:150]}..." for m in memories])
-
 
 class CompoundImaginationAgent(Agent):
     """
@@ -81,6 +89,8 @@ class CompoundImaginationAgent(Agent):
     "So when a man compoundeth the image of his own person with the image of the actions
     of another man... it is a compound imagination, and properly but a fiction of the mind."
     """
+
+    MAX_TOKENS = 384
     
     def __init__(self, name, llm_client, memory_manager):
         # Configure memory for compound imagination
@@ -107,34 +117,31 @@ class CompoundImaginationAgent(Agent):
         from different memories and impressions
         """
 
-        # Get recent simple imaginations and sense impressions with summaries
-        recent_imaginations = await self.memory.get_bucket_with_summaries("simple_imagination")
-        recent_senses = await self.memory.get_bucket_with_summaries("sense_impressions")
-
-        prompt = f"""
-        You are emulating compound imagination as described by Thomas Hobbes in Leviathan.
-        
-        Hobbes explains compound imagination as when "from the sight of a man at one time, and of a horse 
-        at another, we conceive in our mind a centaur" or when a person "compoundeth the image of his own 
-        person with the image of the actions of another man."
-        
-        Current simple imagination:
-        {simple_imagination}
-        
-        Recent sense impressions and imaginations:
-        {self._format_memories(recent_senses + recent_imaginations)}
-        
-        Create a compound imagination that combines elements from the current imagination with elements 
-        from previous impressions or general knowledge. This should be a creative recombination that goes 
-        beyond what was directly perceived - a "fiction of the mind" as Hobbes describes it.
-        
-        This compound imagination might include:
-        1. Analogies or metaphors related to the original input
-        2. Hypothetical scenarios extending from the perceived information
-        3. Creative combinations of different concepts from the current and past impressions
-        """
+        # Get recent simple imaginations and sense impressions with summaries.
+        # The two retrievals are independent, so fetch them in one batch.
+        recent_imaginations, recent_senses = await self.memory.get_many_buckets(
+            ["simple_imagination", "sense_impressions"]
+        )
 
-        compound_imagination = await self.llm.generate(prompt, temperature=0.8)
+        # Sort the combined memories by timestamp so the rendered block is
+        # byte-identical across calls over the same set - interleaving the
+        # two buckets in concatenation order would vary and break provider
+        # prompt-prefix caching on redundant calls
+        combined = sorted(
+            recent_senses + recent_imaginations,
+            key=lambda m: _timestamp_seconds(m.get("timestamp")),
+        )
+        prompt = COMPOUND_IMAGINATION_PROMPT.substitute(
+            simple_imagination=simple_imagination,
+            memories=self._format_memories(combined),
+        )
+
+        compound_imagination = await self.llm.generate(
+            prompt,
+            temperature=0.8,
+            max_tokens=self.MAX_TOKENS,
+            system_message=COMPOUND_IMAGINATION_SYSTEM,
+        )
 
         # Store in memory
         await self.memory.add_memory(
@@ -148,4 +155,4 @@ class CompoundImaginationAgent(Agent):
     def _format_memories(self, memories):
         if not memories:
             return "None"
-        return "\n".join([f"- {m['content'][:150]}..." for m in memories])
+        return "\n".join(f"- {memory_preview(m)}..." for m in memories)
@@ -0,0 +1,13 @@
+# config.py
+"""Configuration for the Hobbesian Mind simulator."""
+
+# Model tiers for per-stage routing. Cheap, low-leverage stages (sense
+# perception's word lists, unguided association) run on the "fast" tier,
+# while stages whose output quality carries the final response (compound
+# imagination, regulated thought, synthesis) run on the "strong" tier.
+# Both tiers default to the same model so routing is a no-op until you
+# point "fast" at a smaller, cheaper model (e.g. "gpt-4o-mini").
+MODEL_TIERS = {
+    "fast": "deepseek-chat",
+    "strong": "deepseek-chat",
+}
@@ -2,6 +2,16 @@
 class Agent:
     """Base class for all thought process agents"""
 
+    # Decode budget for this agent's generate() calls. Decode latency and
+    # cost scale linearly with generated tokens, so each agent caps its
+    # output at what its prompt actually asks for. None means provider max.
+    MAX_TOKENS = None
+
+    # System message sent with this agent's generate() calls, so batch runs
+    # prompt the model the same way the live process() path does. None
+    # means no system message.
+    SYSTEM_MESSAGE = None
+
     def __init__(self, name, llm_client, memory_manager, memory_config=None):
         # Agent identifier
         self.name = name
@@ -37,3 +47,40 @@ class Agent:
     async def process(self, input_text, **kwargs):
         """Process input through this thought process"""
         raise NotImplementedError("Subclasses must implement this")
+
+    async def process_stream(self, input_text, **kwargs):
+        """Process input, yielding output chunks as they are generated
+
+        Optional hook for agents whose output feeds another stage: streaming
+        lets the next stage begin as soon as a usable prefix exists. The
+        default implementation just yields the full process() result once.
+        """
+        yield await self.process(input_text, **kwargs)
+
+    async def process_batch(self, inputs, **kwargs):
+        """Process many inputs through this agent in a single Batch API call
+
+        Used for offline eval/backfill runs where the same agent is driven
+        over a whole corpus. Subclasses that build per-input prompts can
+        override build_prompt() to participate; results come back in input
+        order.
+        """
+        prompts = [self.build_prompt(text, **kwargs) for text in inputs]
+        return await self.llm.generate_batch(
+            prompts, system_message=self.SYSTEM_MESSAGE
+        )
+
+    def build_prompt(self, input_text, **kwargs):
+        """Build the prompt this agent would send for a single input"""
+        raise NotImplementedError("Subclasses must implement this to batch")
+
+    @staticmethod
+    async def _collect_input(input_text):
+        """Accept either a string or an async iterator of chunks from a
+        previous streaming stage, returning the full text"""
+        if isinstance(input_text, str):
+            return input_text
+        chunks = []
+        async for chunk in input_text:
+            chunks.append(chunk)
+        return "".join(chunks)
@@ -1,16 +1,249 @@
 # core/llm_interface.py
+import openai
 from openai import AsyncOpenAI
+import asyncio
+import hashlib
+import httpx
+import json
 import os
+import random
+from collections import OrderedDict
+from functools import lru_cache
 from dotenv import load_dotenv
 
+# orjson is a C-implemented JSON encoder, 2-10x faster than stdlib and
+# producing bytes directly; it matters once batch runs serialize thousands
+# of prompts to JSONL. Optional - stdlib json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load variables from .env file
 load_dotenv()
 
 
+def _json_dumps(obj, sort_keys=False):
+    """Serialize to UTF-8 bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, sort_keys=sort_keys).encode()
+
+# Shared HTTP connection pool and client registry. All LLMClient instances
+# reuse one httpx client so parallel fan-out across agents doesn't queue on
+# the SDK's default 10-connection pool or re-pay TLS handshakes, and agents
+# asking for the same model share one LLMClient (and its caches).
+_shared_http = None
+_clients = {}
+
+
+def _get_http_client():
+    global _shared_http
+    if _shared_http is None or _shared_http.is_closed:
+        # HTTP/2 multiplexes the whole fan-out of concurrent requests over
+        # one TLS session instead of a socket each; it needs the optional
+        # h2 package, so fall back to HTTP/1.1 keep-alive without it
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+        _shared_http = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+            timeout=60.0,
+        )
+    return _shared_http
+
+
+@lru_cache(maxsize=1)
+def get_embedder():
+    """Load the sentence-transformers embedding model once per process
+
+    The model weights run to hundreds of MB, so every SemanticCache (and any
+    future similarity-based memory retrieval) must share one instance.
+    Raises ImportError if sentence-transformers is not installed.
+    """
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer("all-MiniLM-L6-v2")
+
+
+def get_llm_client(model="deepseek-chat", api_key=None, **kwargs):
+    """Return a shared LLMClient for this model, creating it on first use"""
+    key = (model, api_key)
+    if key not in _clients:
+        _clients[key] = LLMClient(model=model, api_key=api_key, **kwargs)
+    return _clients[key]
+
+
+async def aclose_clients():
+    """Close the shared HTTP pool and drop cached clients.
+
+    Call once at process shutdown to avoid leaking sockets.
+    """
+    global _shared_http
+    _clients.clear()
+    if _shared_http is not None and not _shared_http.is_closed:
+        await _shared_http.aclose()
+    _shared_http = None
+
+# Maximum number of responses kept in the in-process exact-match cache
+CACHE_MAX_ENTRIES = 1024
+
+# Retry policy for transient API failures (rate limits, timeouts)
+MAX_RETRIES = 6
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+)
+
+
+class DiskCache:
+    """
+    Persistent response cache backed by SQLite.
+
+    The in-memory caches vanish on restart, so every new process re-pays API
+    latency and token cost for prompts it has already answered. Storing
+    responses on disk makes development replays free and deterministic.
+
+    The cache mode comes from the HOBBES_CACHE_MODE environment variable:
+      record - look up, and store misses after the API call (default)
+      replay - look up only, never write
+      off    - disabled
+    """
+
+    def __init__(self, cache_path, ttl=None):
+        import sqlite3
+        self.mode = os.environ.get("HOBBES_CACHE_MODE", "record").lower()
+        # Optional time-to-live in seconds; entries older than this are
+        # ignored on lookup and pruned lazily
+        self.ttl = ttl
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key BLOB PRIMARY KEY, response TEXT, created_at REAL)"
+        )
+        self._conn.commit()
+        self._lock = asyncio.Lock()
+
+    async def get(self, key):
+        """Return the stored response for a key, or None"""
+        if self.mode == "off":
+            return None
+
+        def _lookup():
+            import time
+            row = self._conn.execute(
+                "SELECT response, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if self.ttl is not None and time.time() - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            return row[0]
+
+        async with self._lock:
+            return await asyncio.to_thread(_lookup)
+
+    async def put(self, key, response):
+        """Store a response unless the cache is read-only"""
+        if self.mode != "record":
+            return
+
+        def _insert():
+            import time
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
+            self._conn.commit()
+
+        async with self._lock:
+            await asyncio.to_thread(_insert)
+
+    def close(self):
+        self._conn.close()
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache tier for LLM responses.
+
+    The agents build highly templated prompts where only the user's input
+    varies, and many inputs are paraphrases of each other ("what is
+    happiness?" vs "define happiness"). Exact-match caching misses those, so
+    this tier embeds each prompt with a small local model and returns a
+    stored response when cosine similarity exceeds the threshold.
+
+    Requires the optional sentence-transformers and numpy packages; if they
+    are not installed the cache silently stays disabled.
+    """
+
+    def __init__(self, threshold=0.9, max_entries=CACHE_MAX_ENTRIES):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.embeddings = None  # np.ndarray of shape (N, D), L2-normalized
+        self.responses = []
+        self._embedder = None
+        self._available = None
+
+    def _ensure_embedder(self):
+        """Lazily load the embedding model; returns False if unavailable"""
+        if self._available is not None:
+            return self._available
+        try:
+            import numpy  # noqa: F401
+            self._embedder = get_embedder()
+            self._available = True
+        except ImportError:
+            self._available = False
+        return self._available
+
+    def _embed(self, text):
+        import numpy as np
+        vector = self._embedder.encode([text])[0]
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, prompt, threshold=None):
+        """Return the cached response for the nearest prompt, or None"""
+        if not self._ensure_embedder() or not self.responses:
+            return None
+        query = self._embed(prompt)
+        sims = self.embeddings @ query
+        best = sims.argmax()
+        if sims[best] >= (threshold or self.threshold):
+            return self.responses[best]
+        return None
+
+    def put(self, prompt, response):
+        """Store a prompt embedding and its response"""
+        if not self._ensure_embedder():
+            return
+        import numpy as np
+        vector = self._embed(prompt)
+        if self.embeddings is None:
+            self.embeddings = vector[None, :]
+        else:
+            self.embeddings = np.vstack([self.embeddings, vector])
+        self.responses.append(response)
+        if len(self.responses) > self.max_entries:
+            self.embeddings = self.embeddings[1:]
+            self.responses.pop(0)
+
+
 class LLMClient:
     """Interface for LLM APIs using OpenAI-compatible endpoints"""
 
-    def __init__(self, model="deepseek-chat", api_key=None):
+    def __init__(
+        self, model="deepseek-chat", api_key=None, semantic_cache_threshold=None,
+        cache_path=None, cache_ttl=None,
+    ):
         self.model = model
         
         # Determine which API to use based on the model name
@@ -33,69 +266,360 @@ class LLMClient:
                     "DeepSeek API key not found. Please set DEEPSEEK_API_KEY environment variable or in .env file."
                 )
 
-        # Initialize client with appropriate configuration
+        # Initialize client with appropriate configuration, reusing the
+        # shared connection pool across all instances
         if self.base_url:
             self.client = AsyncOpenAI(
-                api_key=self.api_key, 
-                base_url=self.base_url
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=_get_http_client(),
             )
         else:
             self.client = AsyncOpenAI(
-                api_key=self.api_key
+                api_key=self.api_key,
+                http_client=_get_http_client(),
             )
 
+        # Exact-match response cache: identical prompts (same model, temperature
+        # and system message) skip the API round trip entirely. Mostly useful
+        # for deterministic (temperature=0) calls and replayed dev runs.
+        self._cache = OrderedDict()
+        self._cache_lock = asyncio.Lock()
+
+        # Optional semantic cache tier: pass a cosine-similarity threshold
+        # (e.g. 0.9) to also serve cached responses for paraphrased prompts.
+        self.semantic_cache = (
+            SemanticCache(semantic_cache_threshold)
+            if semantic_cache_threshold is not None
+            else None
+        )
+
+        # Optional persistent cache: pass cache_path to keep responses across
+        # process restarts for free, deterministic replays.
+        self.disk_cache = DiskCache(cache_path, ttl=cache_ttl) if cache_path else None
+
+        # Bound the number of in-flight requests so gather-based fan-out
+        # doesn't blow through the provider's rate limits
+        self._sem = asyncio.Semaphore(
+            int(os.environ.get("HOBBES_LLM_CONCURRENCY", 32))
+        )
+
+        # Hit/miss counters across all cache tiers, for eyeballing how much
+        # of a run was served without touching the API
+        self.stats = {"hits": 0, "misses": 0}
+
+        # Single-flight table: when parallel agents fire the same cacheable
+        # prompt before either finishes, the duplicates await the first
+        # call's future instead of each paying a full API round trip.
+        self._inflight = {}
+
+    def _cache_key(self, prompt, temperature, system_message, context=None):
+        """Build a compact hash key for the response cache"""
+        key = hashlib.blake2b(
+            f"{self.model}|{temperature}|{system_message or ''}|{prompt}".encode()
+        )
+        if context:
+            key.update(_json_dumps(context, sort_keys=True))
+        return key.digest()
+
+    async def _cache_get(self, key):
+        async with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        return None
+
+    async def _cache_put(self, key, response):
+        async with self._cache_lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _retry_delay(attempt, error):
+        """Backoff delay before retrying a transient API error: exponential
+        in the attempt number with jitter, honoring the provider's
+        Retry-After header when present"""
+        delay = min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY)
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if headers and headers.get("retry-after"):
+            try:
+                delay = max(delay, float(headers["retry-after"]))
+            except ValueError:
+                pass
+        return delay * random.uniform(0.5, 1.5)
+
+    async def _raw_generate(self, messages, temperature, max_tokens,
+                            response_format=None):
+        """Call the chat completions API under the concurrency semaphore,
+        retrying transient failures with exponential backoff"""
+        extra = {}
+        if response_format is not None:
+            extra["response_format"] = response_format
+        for attempt in range(MAX_RETRIES):
+            try:
+                async with self._sem:
+                    response = await self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        stream=False,  # Non-streaming response
+                        **extra,
+                    )
+                return response.choices[0].message.content
+            except _RETRYABLE_ERRORS as e:
+                if attempt == MAX_RETRIES - 1:
+                    raise
+                delay = self._retry_delay(attempt, e)
+                print(f"Transient API error ({e}), retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+
     async def generate(
-        self, prompt, temperature=0.7, max_tokens=None, system_message=None
+        self, prompt=None, temperature=0.7, max_tokens=None, system_message=None,
+        use_cache=None, response_format=None, messages=None,
+    ):
+        """Generate text response from the LLM
+
+        Responses are cached by (model, temperature, system_message, prompt).
+        The cache is consulted for deterministic calls (temperature=0) or when
+        use_cache=True is passed explicitly; pass use_cache=False to force a
+        fresh API call.
+
+        Pass a prebuilt messages list to control the exact message layout:
+        stages within one query can then share a byte-identical leading
+        system + user-input block, which providers with automatic prefix
+        caching serve without re-running its prefill.
+        """
+        if messages is None:
+            # Build message array
+            messages = []
+            if system_message:
+                messages.append({"role": "system", "content": system_message})
+            messages.append({"role": "user", "content": prompt})
+        elif prompt is None:
+            # The cache tiers key on the prompt text; for prebuilt message
+            # lists the serialized list stands in for it
+            prompt = _json_dumps(messages).decode()
+
+        if use_cache is None:
+            use_cache = temperature == 0
+        cache_key = None
+        if use_cache:
+            cache_key = self._cache_key(
+                prompt, temperature, system_message, response_format
+            )
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                self.stats["hits"] += 1
+                return cached
+            # Fall back to the semantic tier for paraphrased prompts
+            if self.semantic_cache is not None:
+                cached = self.semantic_cache.get(prompt)
+                if cached is not None:
+                    self.stats["hits"] += 1
+                    return cached
+
+        # The persistent cache applies to every call so whole runs can be
+        # replayed, not just deterministic ones
+        disk_key = None
+        if self.disk_cache is not None:
+            disk_key = self._cache_key(
+                prompt, temperature, system_message, response_format
+            )
+            cached = await self.disk_cache.get(disk_key)
+            if cached is not None:
+                self.stats["hits"] += 1
+                return cached
+
+        # Coalesce duplicate requests already in flight - cacheable or not.
+        # Two buckets summarizing identical content in the same tick send
+        # byte-identical prompts; the second awaits the first call's future
+        # instead of paying its own round trip.
+        flight_key = cache_key or disk_key or self._cache_key(
+            prompt, temperature, system_message, response_format
+        )
+        existing = self._inflight.get(flight_key)
+        if existing is not None:
+            return await existing
+        flight = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = flight
+
+        try:
+            self.stats["misses"] += 1
+            content = await self._raw_generate(
+                messages, temperature, max_tokens, response_format
+            )
+            if cache_key is not None:
+                await self._cache_put(cache_key, content)
+                if self.semantic_cache is not None:
+                    self.semantic_cache.put(prompt, content)
+            if disk_key is not None:
+                await self.disk_cache.put(disk_key, content)
+            flight.set_result(content)
+            return content
+        except Exception as e:
+            if not flight.done():
+                flight.set_exception(e)
+                # Waiters may or may not exist; don't warn if nobody retrieves it
+                flight.exception()
+            # Log the error for debugging
+            print(f"API Error: {str(e)}")
+            raise
+        finally:
+            self._inflight.pop(flight_key, None)
+
+    async def generate_stream(
+        self, prompt, temperature=0.7, max_tokens=None, system_message=None,
+        conversation_context=None,
     ):
-        """Generate text response from the LLM"""
-        # Build message array
+        """Generate a streaming response, yielding text chunks as they arrive
+
+        Downstream stages can start consuming tokens before the completion
+        finishes, overlapping this call's decode with the next stage's work.
+        Pass conversation_context to stream a context-aware completion, with
+        the same message layout as generate_with_context.
+        """
         messages = []
         if system_message:
             messages.append({"role": "system", "content": system_message})
+        for entry in conversation_context or ():
+            messages.append({"role": entry["role"], "content": entry["content"]})
         messages.append({"role": "user", "content": prompt})
 
+        # Retry only stream establishment. Once the first chunk has been
+        # yielded the caller has consumed partial output, so mid-stream
+        # failures propagate instead of silently restarting the completion.
+        for attempt in range(MAX_RETRIES):
+            try:
+                async with self._sem:
+                    response = await self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        stream=True,
+                    )
+                break
+            except _RETRYABLE_ERRORS as e:
+                if attempt == MAX_RETRIES - 1:
+                    raise
+                delay = self._retry_delay(attempt, e)
+                print(f"Transient API error ({e}), retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+
         try:
-            # Call the appropriate API
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=False,  # Non-streaming response
+            async for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+        except Exception as e:
+            # Log the error for debugging
+            print(f"API Error: {str(e)}")
+            raise
+
+    async def generate_batch(
+        self, prompts, temperature=0.7, max_tokens=None, system_message=None,
+        poll_interval=30,
+    ):
+        """Run many prompts through the provider's Batch API in one submission
+
+        Intended for offline eval and backfill runs: batched requests are
+        roughly half the token cost of live ones and far higher aggregate
+        throughput, at the price of asynchronous completion. Returns the
+        responses in the same order as the prompts.
+        """
+        lines = []
+        for i, prompt in enumerate(prompts):
+            messages = []
+            if system_message:
+                messages.append({"role": "system", "content": system_message})
+            messages.append({"role": "user", "content": prompt})
+            lines.append(_json_dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": messages,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                },
+            }))
+
+        try:
+            # Upload the JSONL request file and kick off the batch
+            batch_file = await self.client.files.create(
+                file=("batch.jsonl", b"\n".join(lines)),
+                purpose="batch",
             )
-            return response.choices[0].message.content
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+
+            # Poll until the batch finishes
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(poll_interval)
+                batch = await self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed":
+                raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+            # Download results and re-order them by custom_id
+            output = await self.client.files.content(batch.output_file_id)
+            results = [None] * len(prompts)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                index = int(record["custom_id"])
+                body = record["response"]["body"]
+                results[index] = body["choices"][0]["message"]["content"]
+            return results
         except Exception as e:
             # Log the error for debugging
             print(f"API Error: {str(e)}")
             raise
-            
+
     async def generate_with_context(
-        self, prompt, conversation_context, temperature=0.7, max_tokens=None, system_message=None
+        self, prompt, conversation_context, temperature=0.7, max_tokens=None,
+        system_message=None, use_cache=None,
     ):
         """Generate text response from the LLM with conversation context"""
         # Build message array with context
         messages = []
-        
+
         if system_message:
             messages.append({"role": "system", "content": system_message})
-            
+
         # Add all conversation context
         for entry in conversation_context:
             messages.append({"role": entry["role"], "content": entry["content"]})
-            
+
         # Add the current prompt
         messages.append({"role": "user", "content": prompt})
 
-        try:
-            # Call the appropriate API
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=False,  # Non-streaming response
+        if use_cache is None:
+            use_cache = temperature == 0
+        cache_key = None
+        if use_cache:
+            cache_key = self._cache_key(
+                prompt, temperature, system_message, context=conversation_context
             )
-            return response.choices[0].message.content
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                self.stats["hits"] += 1
+                return cached
+
+        try:
+            self.stats["misses"] += 1
+            content = await self._raw_generate(messages, temperature, max_tokens)
+            if cache_key is not None:
+                await self._cache_put(cache_key, content)
+            return content
         except Exception as e:
             # Log the error for debugging
             print(f"API Error: {str(e)}")
@@ -1,17 +1,156 @@
 # core/memory.py
+import hashlib
 import json
 import os
+import time
+from collections import deque
 from datetime import datetime
+from itertools import islice
 import asyncio
 
+# orjson cuts bucket (de)serialization CPU several-fold and works on bytes
+# directly; the whole bucket file is rewritten on every memory append, so
+# this is the hot path of each write. Optional - stdlib json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Length of the precomputed content preview stored with each memory.
+# Agents show previews in their prompts on every call, so the slice is
+# paid once per insert instead of once per read.
+PREVIEW_LENGTH = 150
+
+
+def memory_preview(memory):
+    """Return the short preview of a memory, computing it for old entries
+    persisted before previews were stored"""
+    return memory.get("preview") or memory["content"][:PREVIEW_LENGTH]
+
+
+def _timestamp_seconds(ts):
+    """Normalize a stored timestamp to epoch seconds for sorting
+
+    New entries store time.time_ns() ints; entries persisted before that
+    carry ISO strings. Comparing across the two directly would be wrong.
+    """
+    if isinstance(ts, (int, float)):
+        return ts / 1e9
+    try:
+        return datetime.fromisoformat(ts).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def format_timestamp(ts):
+    """Render a stored timestamp as an ISO string at display boundaries"""
+    if isinstance(ts, (int, float)):
+        return datetime.fromtimestamp(ts / 1e9).isoformat()
+    return str(ts)
+
+
+def _tail(entries, n):
+    """Return the last n entries of a list or deque as a list
+
+    deques don't support slicing, so capped buckets take the islice path.
+    """
+    if n <= 0 or not entries:
+        return []
+    if isinstance(entries, deque):
+        return list(islice(entries, max(0, len(entries) - n), len(entries)))
+    return entries[-n:]
+
+
+def _dumps_line(entry):
+    """Serialize one entry as a JSONL line (bytes)"""
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    return (json.dumps(entry) + "\n").encode()
+
+
+# The buckets every MemoryManager starts with, organized by Hobbes'
+# cognitive processes
+DEFAULT_BUCKETS = (
+    # Chapter I - Raw sensory data
+    "sense_impressions",
+    # Chapter II - Persistent and combined impressions
+    "simple_imagination",
+    "compound_imagination",
+    # Chapter III - Different thought processes
+    "unguided_thoughts",
+    "regulated_thoughts",
+    "cause_seeking_thoughts",
+    "effect_seeking_thoughts",
+    # Conversation tracking
+    "conversation",
+    "memory_summaries",
+)
+
+
+class _LazyBuckets:
+    """Dict-like bucket map that loads each bucket from disk on first access
+
+    Startup previously read all nine bucket files synchronously even though a
+    typical turn touches two or three; now a bucket's file is only read the
+    first time something asks for it.
+    """
+
+    def __init__(self, manager, names):
+        self._manager = manager
+        self._names = list(names)
+        self._loaded = {}
+
+    def __getitem__(self, name):
+        if name not in self._loaded:
+            if name not in self._names:
+                raise KeyError(name)
+            self._loaded[name] = self._manager._load_bucket(name)
+        return self._loaded[name]
+
+    def __setitem__(self, name, value):
+        if name not in self._names:
+            self._names.append(name)
+        self._loaded[name] = value
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def keys(self):
+        return list(self._names)
+
+    def is_loaded(self, name):
+        return name in self._loaded
+
 
 class MemoryManager:
     """Manages different memory buckets for thought processes"""
 
-    def __init__(self, storage_dir="./memory_stores", max_recent_memories=5, bucket_configs=None):
+    # Seconds between background flushes of buffered writes
+    FLUSH_INTERVAL = 1.0
+
+    # Write-heavy buckets are sharded into a directory of rotating segment
+    # files instead of one growing log: appends only ever touch the small
+    # current segment, and older segments stay immutable on disk
+    SHARDED_BUCKETS = ("conversation",)
+    SEGMENT_MAX_BYTES = 256 * 1024
+
+    def __init__(self, storage_dir="./memory_stores", max_recent_memories=5, bucket_configs=None,
+                 llm_client=None):
         # Directory where memories are stored
         self.storage_dir = storage_dir
         os.makedirs(storage_dir, exist_ok=True)
+
+        # LLM client for summarization. Held for the manager's lifetime so
+        # summarization reuses one client (and its keep-alive connections)
+        # instead of building a fresh AsyncOpenAI per call; created lazily
+        # when no client is injected.
+        self._llm = llm_client
         
         # Default maximum number of recent memories to keep before summarizing
         self.max_recent_memories = max_recent_memories
@@ -19,61 +158,320 @@ class MemoryManager:
         # Custom configuration for buckets (memory length and summarization prompts)
         self.bucket_configs = bucket_configs or {}
 
-        # Initialize memory buckets organized by Hobbes' cognitive processes
-        self.buckets = {
-            # Chapter I - Raw sensory data
-            "sense_impressions": self._load_bucket("sense_impressions"),
-            # Chapter II - Persistent and combined impressions
-            "simple_imagination": self._load_bucket("simple_imagination"),
-            "compound_imagination": self._load_bucket("compound_imagination"),
-            # Chapter III - Different thought processes
-            "unguided_thoughts": self._load_bucket("unguided_thoughts"),
-            "regulated_thoughts": self._load_bucket("regulated_thoughts"),
-            "cause_seeking_thoughts": self._load_bucket("cause_seeking_thoughts"),
-            "effect_seeking_thoughts": self._load_bucket("effect_seeking_thoughts"),
-            # Conversation tracking
-            "conversation": self._load_bucket("conversation"),
-            "memory_summaries": self._load_bucket("memory_summaries"),
-        }
+        # Memory buckets, loaded lazily: startup registers the bucket names
+        # (defaults plus whatever already exists on disk, e.g. per-bucket
+        # summary stores from earlier runs) but reads no files - each
+        # bucket's file is parsed on first access instead
+        names = list(DEFAULT_BUCKETS)
+        for filename in os.listdir(storage_dir):
+            stem, ext = os.path.splitext(filename)
+            if ext in (".jsonl", ".json") and stem not in names:
+                names.append(stem)
+        self.buckets = _LazyBuckets(self, names)
+
+        # One write lock and a dirty-set drained by a single writer task,
+        # instead of a lock per bucket: appends just mark the bucket dirty
+        # and wake the writer, so multiple appends in the same tick collapse
+        # into one flush and at most one write per bucket is outstanding.
+        self._write_lock = asyncio.Lock()
+        self._dirty = set()
+        self._wake = asyncio.Event()
+
+        # Per-bucket version counters and the memoized memory packs built
+        # from them (see get_memory_pack)
+        self._versions = {}
+        self._pack_cache = {}
+
+        # Per-bucket locks serializing the summarize read-modify-write.
+        # Concurrent pipelines (the batch mode) can trigger overflow on the
+        # same bucket at once; without the lock each pass snapshots the same
+        # oldest window, awaits the LLM, then both truncate - popping a
+        # capped deque empty or double-dropping entries never summarized.
+        self._summarize_locks = {}
+
+        # Write buffer: appends accumulate here and a background task
+        # flushes each dirty bucket once per interval, coalescing a burst of
+        # inserts into a single file write. close() drains the buffer.
+        self._pending = {bucket: [] for bucket in names}
+        self._flusher = None
+
+        # Bucket file paths, computed once per bucket instead of re-joining
+        # strings on every save; new summary buckets are added on first use
+        self._paths = {name: self._compute_paths(name) for name in names}
+
+        # Entry counts for buckets that are still on disk, filled on first
+        # ask (see get_bucket_count). Safe to cache for the session: any
+        # write to a bucket loads it first, and loaded buckets answer from
+        # len() instead.
+        self._disk_counts = {}
 
-        # Locks to prevent file corruption with concurrent writes
-        self.locks = {bucket: asyncio.Lock() for bucket in self.buckets}
+    def _compute_paths(self, bucket_name):
+        base = os.path.join(self.storage_dir, bucket_name)
+        return base + ".jsonl", base + ".json"
+
+    def _get_llm(self):
+        """Return the summarization LLM client, creating it on first need"""
+        if self._llm is None:
+            from core.llm_interface import LLMClient
+            self._llm = LLMClient()
+        return self._llm
+
+    def _bucket_paths(self, bucket_name):
+        """Return the (jsonl, legacy json) file paths for a bucket"""
+        paths = self._paths.get(bucket_name)
+        if paths is None:
+            paths = self._paths[bucket_name] = self._compute_paths(bucket_name)
+        return paths
 
     def _load_bucket(self, bucket_name):
-        """Load memories from disk"""
-        file_path = os.path.join(self.storage_dir, f"{bucket_name}.json")
-        if os.path.exists(file_path):
-            with open(file_path, "r") as f:
-                return json.load(f)
-        return []
+        """Load memories from disk (segment dir, JSONL log, or a legacy
+        JSON array)"""
+        if bucket_name in self.SHARDED_BUCKETS:
+            segments = self._segment_paths(bucket_name)
+            if segments:
+                entries = []
+                for path in segments:
+                    entries.extend(self._read_jsonl(path))
+                return self._wrap_bucket(bucket_name, entries)
+        jsonl_path, legacy_path = self._bucket_paths(bucket_name)
+        if os.path.exists(jsonl_path):
+            return self._wrap_bucket(bucket_name, self._read_jsonl(jsonl_path))
+        if os.path.exists(legacy_path):
+            with open(legacy_path, "rb") as f:
+                data = f.read()
+            entries = orjson.loads(data) if orjson is not None else json.loads(data)
+            return self._wrap_bucket(bucket_name, entries)
+        return self._wrap_bucket(bucket_name, [])
+
+    @staticmethod
+    def _read_jsonl(path):
+        """Parse one JSONL file into a list of entries"""
+        entries = []
+        with open(path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entries.append(
+                        orjson.loads(line) if orjson is not None
+                        else json.loads(line)
+                    )
+        return entries
+
+    def _segment_paths(self, bucket_name):
+        """List a sharded bucket's segment files, oldest first"""
+        seg_dir = os.path.join(self.storage_dir, bucket_name)
+        if not os.path.isdir(seg_dir):
+            return []
+        return [
+            os.path.join(seg_dir, name)
+            for name in sorted(os.listdir(seg_dir))
+            if name.endswith(".jsonl")
+        ]
+
+    def _wrap_bucket(self, bucket_name, entries):
+        """Back capped buckets with a deque
+
+        Buckets with max_memories configured get a deque: appends and the
+        popleft-based truncation after summarization are both O(1), where a
+        list needed an explicit slice-and-copy. The deque is deliberately
+        unbounded - the summarization trigger at 2*max already limits
+        growth, and a maxlen would silently evict the head whenever an
+        append lands while a summarize pass is awaiting the LLM, losing
+        entries that were never summarized.
+        """
+        max_memories = self.bucket_configs.get(bucket_name, {}).get("max_memories")
+        if max_memories:
+            return deque(entries)
+        return entries
 
     async def _save_bucket(self, bucket_name):
-        """Save memories to disk with lock protection"""
-        async with self.locks[bucket_name]:
-            file_path = os.path.join(self.storage_dir, f"{bucket_name}.json")
-            with open(file_path, "w") as f:
-                json.dump(self.buckets[bucket_name], f, indent=2)
+        """Compact a bucket: rewrite its store from the in-memory list
+
+        Used after summarization truncates a bucket, and for the first write
+        after loading a legacy .json store. Routine appends go through
+        _flush_bucket instead, which is O(1) in bucket size. Sharded buckets
+        compact into a single fresh segment, retiring the older ones.
+        """
+        async with self._write_lock:
+            # Drop the buffered appends and serialize the bucket in the same
+            # synchronous block: the compaction covers everything in memory,
+            # and clearing before the lock is acquired would let an append
+            # land in that await window and be persisted twice - once by
+            # this compaction, once by the next flush
+            self._pending.setdefault(bucket_name, []).clear()
+            self._dirty.discard(bucket_name)
+            data = b"".join(
+                _dumps_line(entry) for entry in self.buckets[bucket_name]
+            )
+            if bucket_name in self.SHARDED_BUCKETS:
+                await asyncio.to_thread(self._compact_segments, bucket_name, data)
+            else:
+                jsonl_path, _ = self._bucket_paths(bucket_name)
+                await asyncio.to_thread(self._replace_file, jsonl_path, data)
+
+    def _compact_segments(self, bucket_name, data):
+        """Blocking half of a sharded compaction: atomically replace the
+        first segment with the full store, then drop the other segments"""
+        seg_dir = os.path.join(self.storage_dir, bucket_name)
+        os.makedirs(seg_dir, exist_ok=True)
+        keep = os.path.join(seg_dir, "segment-000000.jsonl")
+        self._replace_file(keep, data)
+        for path in self._segment_paths(bucket_name):
+            if path != keep:
+                os.remove(path)
+
+    @staticmethod
+    def _write_file(path, data, mode):
+        """Blocking file write, run off the event loop via asyncio.to_thread
+        so a large compaction doesn't stall concurrent agent work"""
+        with open(path, mode) as f:
+            f.write(data)
+
+    @staticmethod
+    def _replace_file(path, data):
+        """Atomically replace a bucket log: write a sibling temp file, then
+        os.replace it over the log so a crash mid-compaction can never leave
+        a half-written store"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _queue_entry(self, bucket_name, entry):
+        """Buffer an entry for the next periodic flush
+
+        Keeping appends in RAM and flushing once per interval coalesces the
+        JSON encoding and syscalls of a burst of inserts into one write.
+        """
+        self._pending.setdefault(bucket_name, []).append(entry)
+        self._dirty.add(bucket_name)
+        self._wake.set()
+        self._ensure_flusher()
+
+    def _ensure_flusher(self):
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            # Short coalescing window so a burst of appends lands in one write
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+            await self.flush()
+
+    async def flush(self):
+        """Write all buffered entries to their bucket logs"""
+        dirty = self._dirty.copy()
+        self._dirty.clear()
+        for bucket_name in dirty:
+            await self._flush_bucket(bucket_name)
+
+    async def _flush_bucket(self, bucket_name):
+        """Append a bucket's pending entries to its JSONL log in one write"""
+        pending = self._pending[bucket_name]
+        if not pending:
+            return
+        entries = pending[:]
+        pending.clear()
+        if bucket_name in self.SHARDED_BUCKETS:
+            if not self._segment_paths(bucket_name):
+                # First write after loading a legacy single-file store (or a
+                # brand-new bucket): compact into the initial segment
+                await self._save_bucket(bucket_name)
+                return
+            async with self._write_lock:
+                data = b"".join(_dumps_line(entry) for entry in entries)
+                await asyncio.to_thread(self._append_segment, bucket_name, data)
+            return
+        jsonl_path, _ = self._bucket_paths(bucket_name)
+        if not os.path.exists(jsonl_path):
+            # First write after loading a legacy .json store (or a brand-new
+            # bucket): compact so the log holds every in-memory entry
+            await self._save_bucket(bucket_name)
+            return
+        async with self._write_lock:
+            data = b"".join(_dumps_line(entry) for entry in entries)
+            await asyncio.to_thread(self._write_file, jsonl_path, data, "ab")
+
+    def _append_segment(self, bucket_name, data):
+        """Blocking append to a sharded bucket's current segment, rotating
+        to a fresh file once the segment passes SEGMENT_MAX_BYTES"""
+        segments = self._segment_paths(bucket_name)
+        current = segments[-1]
+        if os.path.getsize(current) >= self.SEGMENT_MAX_BYTES:
+            seg_dir = os.path.join(self.storage_dir, bucket_name)
+            current = os.path.join(seg_dir, f"segment-{len(segments):06d}.jsonl")
+        self._write_file(current, data, "ab")
+
+    async def close(self):
+        """Stop the background flusher and drain any buffered writes
+
+        Call from the application shutdown path so nothing is lost.
+        """
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
 
     async def add_memory(self, content, bucket_name, metadata=None):
         """Add a thought to a specific memory bucket"""
         memory = {
             "content": content,
-            "timestamp": datetime.now().isoformat(),
+            "preview": content[:PREVIEW_LENGTH],
+            "timestamp": time.time_ns(),
             "metadata": metadata or {},
         }
 
         self.buckets[bucket_name].append(memory)
-        await self._save_bucket(bucket_name)
+        self._bump_version(bucket_name)
+        self._queue_entry(bucket_name, memory)
         
         # Check if we need to summarize this bucket (like we do with conversation)
         if bucket_name in self.bucket_configs and "max_memories" in self.bucket_configs[bucket_name]:
             max_memories = self.bucket_configs[bucket_name]["max_memories"]
-            # If we have twice as many memories as our max, summarize
-            if len(self.buckets[bucket_name]) > max_memories * 2:
+            # Summarize once we hit twice our max, before the bucket can
+            # grow any further
+            if len(self.buckets[bucket_name]) >= max_memories * 2:
                 await self._summarize_bucket(bucket_name)
                 
         return memory
 
+    async def add_memories_batch(self, entries):
+        """Add several memories at once; entries are (content, bucket_name,
+        metadata) tuples.
+
+        All entries share one timestamp and land in the write buffer
+        together, so the whole batch is persisted by a single flush.
+        """
+        timestamp = time.time_ns()
+        memories = []
+        for content, bucket_name, metadata in entries:
+            memory = {
+                "content": content,
+                "preview": content[:PREVIEW_LENGTH],
+                "timestamp": timestamp,
+                "metadata": metadata or {},
+            }
+            self.buckets[bucket_name].append(memory)
+            self._bump_version(bucket_name)
+            memories.append(memory)
+            self._queue_entry(bucket_name, memory)
+
+            # Run the same overflow check as add_memory after every append,
+            # so a large batch summarizes as it goes instead of piling a
+            # whole batch of un-summarized entries past the trigger point
+            config = self.bucket_configs.get(bucket_name, {})
+            if "max_memories" in config:
+                if len(self.buckets[bucket_name]) >= config["max_memories"] * 2:
+                    await self._summarize_bucket(bucket_name)
+
+        return memories
+
     async def get_recent_memories(self, bucket_name, limit=None):
         """Get the most recent memories from a bucket"""
         # Use bucket-specific limit if configured, otherwise use provided limit or default
@@ -83,20 +481,20 @@ class MemoryManager:
             else:
                 limit = self.max_recent_memories
                 
-        memories = self.buckets[bucket_name]
-        return memories[-limit:] if memories else []
+        return _tail(self.buckets[bucket_name], limit)
         
     async def add_conversation_entry(self, role, content, metadata=None):
         """Add an entry to the conversation history"""
         entry = {
             "role": role,  # 'user' or 'system'
             "content": content,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time_ns(),
             "metadata": metadata or {},
         }
         
         self.buckets["conversation"].append(entry)
-        await self._save_bucket("conversation")
+        self._bump_version("conversation")
+        self._queue_entry("conversation", entry)
         
         # Get bucket-specific max memories or use default
         max_memories = self.max_recent_memories
@@ -104,7 +502,7 @@ class MemoryManager:
             max_memories = self.bucket_configs["conversation"]["max_memories"]
         
         # Check if we need to summarize older conversation entries
-        if len(self.buckets["conversation"]) > max_memories * 2:
+        if len(self.buckets["conversation"]) >= max_memories * 2:
             await self._summarize_conversation()
             
         return entry
@@ -122,58 +520,66 @@ class MemoryManager:
             if "summary_prompt" in config:
                 summary_prompt = config["summary_prompt"]
         
-        # Keep the most recent entries
-        recent_entries = self.buckets["conversation"][-max_memories:]
-        entries_to_summarize = self.buckets["conversation"][:-max_memories]
-        
-        if not entries_to_summarize:
-            return
-            
-        # Create a prompt for summarization
-        entries_text = "\n".join([
-            f"{entry['role'].upper()}: {entry['content'][:200]}..." 
-            if len(entry['content']) > 200 else 
-            f"{entry['role'].upper()}: {entry['content']}"
-            for entry in entries_to_summarize
-        ])
-        
-        # Use the LLM to create a summary
-        from core.llm_interface import LLMClient
-        llm = LLMClient()
-        
-        # Use custom prompt if provided, otherwise use default
-        if summary_prompt:
-            # Replace {entries} placeholder with the actual entries
-            prompt = summary_prompt.replace("{entries}", entries_text)
-        else:
-            prompt = f"""
-            Summarize the following conversation exchanges while preserving the key points:
-            
-            {entries_text}
-            
-            Create a concise summary that captures the essential information.
-            Focus on the main topics, requests, and responses while reducing the length significantly.
-            """
-        
-        summary = await llm.generate(prompt, temperature=0.5)
-        
-        # Store the summary in memory_summaries
-        summary_entry = {
-            "content": summary,
-            "timestamp": datetime.now().isoformat(),
-            "entries_summarized": len(entries_to_summarize),
-            "first_timestamp": entries_to_summarize[0]["timestamp"],
-            "last_timestamp": entries_to_summarize[-1]["timestamp"],
-        }
-        
-        self.buckets["memory_summaries"].append(summary_entry)
-        await self._save_bucket("memory_summaries")
-        
-        # Replace the old entries with just the recent ones
-        self.buckets["conversation"] = recent_entries
-        await self._save_bucket("conversation")
-        
-        return summary_entry
+        # The whole read-modify-write runs under the bucket's summarize
+        # lock; the window is computed inside it, so a trigger that queued
+        # behind another pass sees the already-truncated bucket and bails
+        # instead of dropping a second window.
+        async with self._summarize_lock("conversation"):
+            # Summarize a bounded window of the oldest entries rather than
+            # everything past the tail: a large backlog (e.g. after a crash
+            # left an oversized file) would otherwise produce one
+            # O(N)-token LLM call. Anything beyond the window stays put for
+            # the next trigger.
+            entries_to_summarize = self._oldest_window("conversation", max_memories)
+
+            if not entries_to_summarize:
+                return
+
+            # Create a prompt for summarization
+            entries_text = "\n".join(
+                f"{entry['role'].upper()}: {entry['content'][:200]}..."
+                if len(entry['content']) > 200 else
+                f"{entry['role'].upper()}: {entry['content']}"
+                for entry in entries_to_summarize
+            )
+
+            # Use the LLM to create a summary
+            llm = self._get_llm()
+
+            # Use custom prompt if provided, otherwise use default
+            if summary_prompt:
+                # Replace {entries} placeholder with the actual entries
+                prompt = summary_prompt.replace("{entries}", entries_text)
+            else:
+                prompt = f"""
+                Summarize the following conversation exchanges while preserving the key points:
+
+                {entries_text}
+
+                Create a concise summary that captures the essential information.
+                Focus on the main topics, requests, and responses while reducing the length significantly.
+                """
+
+            summary = await llm.generate(prompt, temperature=0.5)
+
+            # Store the summary in memory_summaries
+            summary_entry = {
+                "content": summary,
+                "timestamp": time.time_ns(),
+                "entries_summarized": len(entries_to_summarize),
+                "first_timestamp": entries_to_summarize[0]["timestamp"],
+                "last_timestamp": entries_to_summarize[-1]["timestamp"],
+            }
+
+            self.buckets["memory_summaries"].append(summary_entry)
+            self._queue_entry("memory_summaries", summary_entry)
+
+            # Drop the summarized window in place instead of rebuilding the list
+            self._drop_oldest("conversation", len(entries_to_summarize))
+            self._bump_version("conversation")
+            await self._save_bucket("conversation")
+
+            return summary_entry
         
     async def _summarize_bucket(self, bucket_name):
         """Summarize older entries in any memory bucket"""
@@ -188,65 +594,69 @@ class MemoryManager:
             if "summary_prompt" in config:
                 summary_prompt = config["summary_prompt"]
         
-        # Keep the most recent entries
-        recent_entries = self.buckets[bucket_name][-max_memories:]
-        entries_to_summarize = self.buckets[bucket_name][:-max_memories]
-        
-        if not entries_to_summarize:
-            return
-            
-        # Format entries for summarization
-        entries_text = "\n".join([
-            f"MEMORY: {entry['content'][:200]}..." 
-            if len(entry['content']) > 200 else 
-            f"MEMORY: {entry['content']}"
-            for entry in entries_to_summarize
-        ])
-        
-        # Use the LLM to create a summary
-        from core.llm_interface import LLMClient
-        llm = LLMClient()
-        
-        # Use custom prompt if provided, otherwise use default
-        if summary_prompt:
-            # Replace {entries} placeholder with the actual entries
-            prompt = summary_prompt.replace("{entries}", entries_text)
-        else:
-            prompt = f"""
-            Summarize the following {bucket_name} memories while preserving the key points:
-            
-            {entries_text}
-            
-            Create a concise summary that captures the essential information.
-            Focus on the main concepts and details while reducing the length significantly.
-            """
-        
-        summary = await llm.generate(prompt, temperature=0.5)
-        
-        # Store the summary
-        summary_entry = {
-            "content": summary,
-            "timestamp": datetime.now().isoformat(),
-            "bucket": bucket_name,
-            "entries_summarized": len(entries_to_summarize),
-            "first_timestamp": entries_to_summarize[0]["timestamp"],
-            "last_timestamp": entries_to_summarize[-1]["timestamp"],
-        }
-        
-        # Create a summary bucket for this type if it doesn't exist
-        summary_bucket = f"{bucket_name}_summaries"
-        if summary_bucket not in self.buckets:
-            self.buckets[summary_bucket] = []
-            self.locks[summary_bucket] = asyncio.Lock()
-        
-        self.buckets[summary_bucket].append(summary_entry)
-        await self._save_bucket(summary_bucket)
-        
-        # Replace the old entries with just the recent ones
-        self.buckets[bucket_name] = recent_entries
-        await self._save_bucket(bucket_name)
-        
-        return summary_entry
+        # Serialized per bucket for the same reason as
+        # _summarize_conversation: the window must be computed under the
+        # lock so queued triggers see the truncated bucket and bail.
+        async with self._summarize_lock(bucket_name):
+            # Same bounded window as _summarize_conversation: cap each pass
+            # at max_memories of the oldest entries so summarization prompts
+            # stay a fixed size no matter how far the bucket has overgrown
+            entries_to_summarize = self._oldest_window(bucket_name, max_memories)
+
+            if not entries_to_summarize:
+                return
+
+            # Format entries for summarization
+            entries_text = "\n".join(
+                f"MEMORY: {entry['content'][:200]}..."
+                if len(entry['content']) > 200 else
+                f"MEMORY: {entry['content']}"
+                for entry in entries_to_summarize
+            )
+
+            # Use the LLM to create a summary
+            llm = self._get_llm()
+
+            # Use custom prompt if provided, otherwise use default
+            if summary_prompt:
+                # Replace {entries} placeholder with the actual entries
+                prompt = summary_prompt.replace("{entries}", entries_text)
+            else:
+                prompt = f"""
+                Summarize the following {bucket_name} memories while preserving the key points:
+
+                {entries_text}
+
+                Create a concise summary that captures the essential information.
+                Focus on the main concepts and details while reducing the length significantly.
+                """
+
+            summary = await llm.generate(prompt, temperature=0.5)
+
+            # Store the summary
+            summary_entry = {
+                "content": summary,
+                "timestamp": time.time_ns(),
+                "bucket": bucket_name,
+                "entries_summarized": len(entries_to_summarize),
+                "first_timestamp": entries_to_summarize[0]["timestamp"],
+                "last_timestamp": entries_to_summarize[-1]["timestamp"],
+            }
+
+            # Create a summary bucket for this type if it doesn't exist
+            summary_bucket = f"{bucket_name}_summaries"
+            if summary_bucket not in self.buckets:
+                self.buckets[summary_bucket] = []
+
+            self.buckets[summary_bucket].append(summary_entry)
+            self._queue_entry(summary_bucket, summary_entry)
+
+            # Drop the summarized window in place instead of rebuilding the list
+            self._drop_oldest(bucket_name, len(entries_to_summarize))
+            self._bump_version(bucket_name)
+            await self._save_bucket(bucket_name)
+
+            return summary_entry
         
     async def get_bucket_with_summaries(self, bucket_name, include_summaries=True):
         """Get memories from a bucket, including summaries of older entries if available"""
@@ -260,8 +670,12 @@ class MemoryManager:
             latest_summary = self.buckets[summary_bucket][-1]
             
             # Create a summary memory entry
+            summary_content = (
+                f"SUMMARY OF OLDER {bucket_name.upper()}: {latest_summary['content']}"
+            )
             summary_memory = {
-                "content": f"SUMMARY OF OLDER {bucket_name.upper()}: {latest_summary['content']}",
+                "content": summary_content,
+                "preview": summary_content[:PREVIEW_LENGTH],
                 "timestamp": latest_summary["timestamp"],
                 "metadata": {
                     "is_summary": True,
@@ -270,10 +684,139 @@ class MemoryManager:
             }
             
             # Add the summary at the beginning
-            return [summary_memory] + memories
-            
-        return memories
+            return [summary_memory, *memories]
+
+        return memories if isinstance(memories, list) else list(memories)
     
+    def _summarize_lock(self, bucket_name):
+        """Return the bucket's summarization lock, creating it on first use"""
+        lock = self._summarize_locks.get(bucket_name)
+        if lock is None:
+            lock = self._summarize_locks[bucket_name] = asyncio.Lock()
+        return lock
+
+    def _oldest_window(self, bucket_name, max_memories):
+        """Return the bounded window of oldest entries to summarize: at most
+        max_memories entries, and only those past the retained tail"""
+        bucket = self.buckets[bucket_name]
+        excess = len(bucket) - max_memories
+        if excess <= 0:
+            return []
+        return list(islice(bucket, 0, min(max_memories, excess)))
+
+    def _drop_oldest(self, bucket_name, count):
+        """Remove the oldest count entries from a bucket in place"""
+        bucket = self.buckets[bucket_name]
+        if isinstance(bucket, deque):
+            for _ in range(count):
+                bucket.popleft()
+        else:
+            del bucket[:count]
+
+    def get_bucket_count(self, bucket_name):
+        """Number of entries in a bucket, without forcing a lazy load
+
+        Loaded buckets answer with len(); unloaded ones get a raw line
+        count of their files - no JSON parsing - cached for the session.
+        Listing every bucket (the shell's `memory` command) stays cheap
+        even when most stores were never touched this run.
+        """
+        if self.buckets.is_loaded(bucket_name):
+            return len(self.buckets[bucket_name])
+        count = self._disk_counts.get(bucket_name)
+        if count is None:
+            count = self._count_disk_entries(bucket_name)
+            self._disk_counts[bucket_name] = count
+        return count
+
+    def _count_disk_entries(self, bucket_name):
+        # A sharded bucket with no segments yet may still live in a legacy
+        # single-file store from before sharding - count it like any other
+        # bucket instead of reporting 0 over the segment dir alone
+        paths = None
+        if bucket_name in self.SHARDED_BUCKETS:
+            paths = self._segment_paths(bucket_name) or None
+        if paths is None:
+            jsonl_path, legacy_path = self._bucket_paths(bucket_name)
+            if os.path.exists(jsonl_path):
+                paths = [jsonl_path]
+            elif os.path.exists(legacy_path):
+                # Legacy array files have no line-per-entry layout; loading
+                # the bucket is the only way to count it
+                return len(self.buckets[bucket_name])
+            else:
+                return 0
+        count = 0
+        for path in paths:
+            with open(path, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        count += 1
+        return count
+
+    def export_pretty(self, bucket_name, path):
+        """Write an indented, human-readable JSON dump of a bucket
+
+        The persistence path is deliberately un-indented (indent roughly
+        doubles both serialization cost and file size); this helper exists
+        for eyeballing a store without piping it through jq.
+        """
+        with open(path, "w") as f:
+            json.dump(list(self.buckets[bucket_name]), f, indent=2)
+
+    def _bump_version(self, bucket_name):
+        """Record that a bucket changed, invalidating its memoized pack"""
+        self._versions[bucket_name] = self._versions.get(bucket_name, 0) + 1
+
+    async def get_memory_pack(self, bucket_name, k=None):
+        """Return (text, version_hash) for the most recent k memories
+
+        The pack is rendered from the top-k entries sorted by timestamp and
+        memoized until the bucket changes, so redundant calls emit
+        byte-identical text (and an unchanged version hash) instead of
+        invalidating downstream prompt-prefix caches.
+        """
+        if k is None:
+            config = self.bucket_configs.get(bucket_name, {})
+            k = config.get("max_memories", self.max_recent_memories)
+
+        version = self._versions.get(bucket_name, 0)
+        cached = self._pack_cache.get(bucket_name)
+        if cached is not None and cached[0] == (version, k):
+            return cached[1], cached[2]
+
+        recent = sorted(
+            _tail(self.buckets[bucket_name], k),
+            key=lambda m: _timestamp_seconds(m.get("timestamp")),
+        )
+        lines = [f"- {memory_preview(m)}" for m in recent]
+        # Lead with the latest summary of older entries, mirroring
+        # get_bucket_with_summaries; summarization bumps the bucket version,
+        # so a new summary invalidates the memoized pack
+        summary_bucket = f"{bucket_name}_summaries"
+        if summary_bucket in self.buckets and self.buckets[summary_bucket]:
+            latest_summary = self.buckets[summary_bucket][-1]
+            lines.insert(
+                0,
+                f"- SUMMARY OF OLDER {bucket_name.upper()}: "
+                f"{latest_summary['content']}",
+            )
+        text = "\n".join(lines)
+        version_hash = hashlib.md5(text.encode()).hexdigest()[:8]
+        self._pack_cache[bucket_name] = ((version, k), text, version_hash)
+        return text, version_hash
+
+    async def get_many_buckets(self, bucket_names, include_summaries=True):
+        """Fetch several buckets (with their summaries) concurrently
+
+        One gather over the per-bucket retrievals instead of awaiting them
+        one after another, so callers pay a single round trip.
+        """
+        return await asyncio.gather(*[
+            self.get_bucket_with_summaries(name, include_summaries)
+            for name in bucket_names
+        ])
+
     async def get_conversation_context(self, include_summaries=True):
         """Get conversation context for the LLM, including summaries of older exchanges"""
         # Get bucket-specific max memories or use default
@@ -282,7 +825,7 @@ class MemoryManager:
             max_memories = self.bucket_configs["conversation"]["max_memories"]
         
         # Start with the most recent conversation entries up to the configured limit
-        context = self.buckets["conversation"][-max_memories:] if self.buckets["conversation"] else []
+        context = _tail(self.buckets["conversation"], max_memories)
         
         # Add summaries of older exchanges if requested
         if include_summaries and self.buckets["memory_summaries"]:
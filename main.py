@@ -1,7 +1,20 @@
 # main.py
 import asyncio
-from core.memory import MemoryManager
-from core.llm_interface import LLMClient
+import json
+import re
+import sys
+from itertools import islice
+from config import MODEL_TIERS
+
+# Async line editing for the REPL - with the builtin input() the event loop
+# would block while the user types, stalling background flushes and any
+# speculative work. Optional; we fall back to input() on a worker thread.
+try:
+    from prompt_toolkit import PromptSession
+except ImportError:
+    PromptSession = None
+from core.memory import MemoryManager, format_timestamp
+from core.llm_interface import get_llm_client, aclose_clients
 
 # Import agents from chapters
 from chapters.ch01_sense import SenseAgent
@@ -14,78 +27,210 @@ from chapters.ch03_train_of_thought import (
 )
 
 
+# Keyword heuristics for the cause/effect classification. Most queries wear
+# their direction on their sleeve ("why ..." vs "what happens if ..."), and a
+# regex answers those for free on the CPU; only queries matching neither or
+# both patterns fall through to the LLM.
+_CAUSE_RE = re.compile(
+    r"\b(why|how come|how did|cause[sd]?|because|origin|reason)\b", re.I
+)
+_EFFECT_RE = re.compile(
+    r"\b(what if|result[s]?|effect[s]?|consequence[s]?|outcome[s]?|"
+    r"will happen|would happen|impact|lead[s]? to)\b", re.I
+)
+
+
+# Shared preamble for the per-query routing calls (goal extraction and
+# cause/effect classification). Each call sends the same system + user-input
+# block followed by a constant stage instruction, so providers with automatic
+# prompt-prefix caching (OpenAI, Anthropic, DeepSeek) only re-run prefill for
+# the final message. The prefix must stay byte-identical across calls - any
+# per-stage formatting of user_input would break the cache.
+SHARED_SYSTEM = (
+    "You are a Hobbesian cognition engine. The next message is the user "
+    "input; answer only the instruction that follows it."
+)
+
+_CLASSIFY_INSTRUCTION = (
+    'Reply with JSON only: {"goal": the goal or desire that would direct '
+    'regulated thought about this input (one short sentence), '
+    '"mode": "CAUSES" if the user seeks why/how something is, '
+    '"EFFECTS" if they seek what follows from it}'
+)
+
+_GOAL_INSTRUCTION = (
+    "In one short sentence, the goal or desire that would direct "
+    "regulated thought about this input.\nGoal:"
+)
+
+_MODE_INSTRUCTION = (
+    "Is this asking about CAUSES (why/how something is) or EFFECTS "
+    "(what follows from it)? One word:"
+)
+
+
+def _local_cause_classifier(text):
+    """Classify a query as cause-seeking (True), effect-seeking (False), or
+    ambiguous (None, meaning ask the LLM)"""
+    cause = bool(_CAUSE_RE.search(text))
+    effect = bool(_EFFECT_RE.search(text))
+    if cause != effect:
+        return cause
+    return None
+
+
 class HobbesianMind:
     """Main orchestrator for Hobbesian thought processes"""
 
-    def __init__(self, model):
-        # Core components
-        self.memory = MemoryManager()
-        self.llm = LLMClient(model=model)
+    def __init__(self, model=None, fast_model=None):
+        # Two model tiers: the strong model for synthesis-grade stages, a
+        # fast/cheap one for low-leverage stages. get_llm_client returns the
+        # same shared client when the tiers resolve to the same model.
+        self.llm = get_llm_client(model=model or MODEL_TIERS["strong"])
+        self.fast_llm = get_llm_client(model=fast_model or MODEL_TIERS["fast"])
+
+        # Memory shares the strong client so its summarization calls reuse
+        # the same connection pool instead of building their own client
+        self.memory = MemoryManager(llm_client=self.llm)
 
         # Initialize agents for each chapter
         # Chapter I: Of Sense - processes raw input into sensory impressions
-        self.sense_agent = SenseAgent("sense", self.llm, self.memory)
+        self.sense_agent = SenseAgent("sense", self.fast_llm, self.memory)
 
-        # Chapter II: Of Imagination - transforms sensory data into imagination
+        # Chapter II: Of Imagination - transforms sensory data into imagination.
+        # Simple imagination is a light transformation of the sense stage and
+        # sits on the latency-critical path into compound imagination, so it
+        # runs on the fast tier: lower TTFT and decode latency there outweigh
+        # the flagship model's extra polish on an intermediate stage.
         self.simple_imagination_agent = SimpleImaginationAgent(
-            "simple_imagination", self.llm, self.memory
+            "simple_imagination", self.fast_llm, self.memory
         )
         self.compound_imagination_agent = CompoundImaginationAgent(
             "compound_imagination", self.llm, self.memory
         )
 
         # Chapter III: Of the Consequence or Train of Imaginations - develops thought processes
-        self.unguided_agent = UnguidedThoughtAgent("unguided", self.llm, self.memory)
+        self.unguided_agent = UnguidedThoughtAgent("unguided", self.fast_llm, self.memory)
         self.regulated_agent = RegulatedThoughtAgent("regulated", self.llm, self.memory)
         self.cause_agent = CauseSeekingAgent("cause_seeking", self.llm, self.memory)
         self.effect_agent = EffectSeekingAgent("effect_seeking", self.llm, self.memory)
 
-    async def _extract_goal(self, user_input):
-        """Extract a goal from user input for regulated thought"""
-        prompt = f"""
-        Given this user input: "{user_input}"
-        
-        Extract a clear goal or desire that would direct regulated thought in the Hobbesian sense.
-        What would someone asking this question ultimately want to achieve or understand?
-        
-        Goal:
+    async def _classify_and_goal(self, user_input):
+        """Extract the regulated-thought goal and classify the query as
+        cause- or effect-seeking in one structured LLM call
+
+        The two questions share the same user-input preamble, so fusing
+        them halves the round trips and prefill paid for this stage.
+        Returns (goal, should_seek_causes).
         """
+        # When the keyword heuristic settles the classification, only the
+        # goal still needs the model - a shorter, cheaper call
+        should_seek_causes = _local_cause_classifier(user_input)
+        if should_seek_causes is not None:
+            goal = await self._extract_goal(user_input)
+            return goal, should_seek_causes
+
+        # One tight sentence each: decode time is linear in output tokens,
+        # so the JSON is capped at what the two fields actually need.
+        # Goal extraction and classification are routing decisions, not
+        # user-facing prose - the fast tier answers them just as well.
+        response = await self.fast_llm.generate(
+            messages=self._stage_messages(user_input, _CLASSIFY_INSTRUCTION),
+            temperature=0.3, max_tokens=64,
+            response_format={"type": "json_object"},
+        )
+        try:
+            parsed = json.loads(response)
+            goal = str(parsed["goal"]).strip()
+            should_seek_causes = "CAUSE" in str(parsed.get("mode", "")).upper()
+            if goal:
+                return goal, should_seek_causes
+        except (json.JSONDecodeError, KeyError, TypeError):
+            pass
+
+        # Malformed output: fall back to the original two separate calls
+        goal = await self._extract_goal(user_input)
+        return goal, await self._should_seek_causes(user_input)
+
+    @staticmethod
+    def _stage_messages(user_input, stage_instruction):
+        """Message layout for per-query routing calls: the shared system +
+        user-input prefix followed by the stage-specific instruction"""
+        return [
+            {"role": "system", "content": SHARED_SYSTEM},
+            {"role": "user", "content": user_input},
+            {"role": "user", "content": stage_instruction},
+        ]
 
-        goal = await self.llm.generate(prompt, temperature=0.5)
+    async def _extract_goal(self, user_input):
+        """Extract a goal from user input for regulated thought"""
+        goal = await self.fast_llm.generate(
+            messages=self._stage_messages(user_input, _GOAL_INSTRUCTION),
+            temperature=0.5, max_tokens=48,
+        )
         return goal.strip()
 
     async def _should_seek_causes(self, user_input):
         """Determine if the query is asking for causes rather than effects"""
-        prompt = f"""
-        Given this user input: "{user_input}"
-        
-        Determine if the user is more likely seeking:
-        1. The CAUSES of something (why/how something happened or exists)
-        2. The EFFECTS of something (what would result from or follow something)
-        
-        Answer with just "CAUSES" or "EFFECTS":
-        """
-
-        result = await self.llm.generate(prompt, temperature=0.3)
+        result = await self.fast_llm.generate(
+            messages=self._stage_messages(user_input, _MODE_INSTRUCTION),
+            temperature=0.3, max_tokens=16,
+        )
         return "CAUSE" in result.upper()
 
-    async def _synthesize_response(self, user_input, results):
-        """Create final response by integrating different thought processes"""
-        # Create the list of thought processes that were used
-        thought_processes = []
+    async def _summarize_stage(self, content):
+        """Digest one stage's output to ~30 words on the fast model
+
+        These run in the background while later pipeline stages are still
+        in flight, so the final synthesis call reads short digests instead
+        of raw 200-char slices - less prefill on the expensive call, and
+        a whole thought rather than a truncated one.
+        """
+        return await self.fast_llm.generate(
+            f"Summarize in at most 30 words:\n{content}",
+            temperature=0.3,
+            max_tokens=60,
+        )
+
+    async def _synthesize_response(self, user_input, results, stream=False,
+                                   summaries=None):
+        """Create final response by integrating different thought processes
 
+        With stream=True the response is printed token by token as it
+        arrives, so the user starts reading at time-to-first-token instead
+        of waiting out the whole completion; the full text is still
+        returned for conversation history. summaries maps stage names to
+        pre-computed digests used in place of truncated raw output.
+        """
+        summaries = summaries or {}
+
+        # Pack the thought processes as one JSON object keyed by stage name:
+        # a single C-accelerated json.dumps instead of per-entry string
+        # concatenation, and no per-line label prose for the model to parse.
+        # Stages whose opening text duplicates an earlier one are dropped -
+        # near-identical stages would just bill the same prefill tokens twice.
+        seen = set()
+        payload = {}
         for process_name, content in results.items():
-            if process_name != "final_response" and process_name != "original_input":
-                thought_processes.append(f"{process_name}: {content[:200]}...")
+            if process_name in ("final_response", "original_input") or not content:
+                continue
+            content = summaries.get(process_name) or content[:300]
+            prefix = content[:80]
+            if prefix in seen:
+                continue
+            seen.add(prefix)
+            payload[process_name] = content
+        thought_processes = json.dumps(payload)
 
         # Get conversation context
         conversation_context = await self.memory.get_conversation_context()
         
         prompt = f"""
         You are a philosophical AI system modeled after Thomas Hobbes' understanding of human cognition.
-        You have processed the user's question through multiple Hobbesian thought processes:
-        
-        {' '.join(thought_processes)}
+        You have processed the user's question through multiple Hobbesian thought processes,
+        given here as a JSON object keyed by process name:
+
+        {thought_processes}
         
         Based on these thought processes, craft a thoughtful, philosophical response to:
         "{user_input}"
@@ -98,83 +243,199 @@ class HobbesianMind:
         """
 
         # Use context-aware generation if there's conversation history
+        system_prompt = None
         if len(conversation_context) > 1:  # More than just the current user query
-            system_prompt = """You are a philosophical AI system modeled after Thomas Hobbes' understanding 
-            of human cognition. Your responses should be philosophical yet accessible, showing how Hobbesian 
+            system_prompt = """You are a philosophical AI system modeled after Thomas Hobbes' understanding
+            of human cognition. Your responses should be philosophical yet accessible, showing how Hobbesian
             thought processes lead to understanding. Reference previous conversation when relevant."""
-            
-            response = await self.llm.generate_with_context(
+        else:
+            conversation_context = None
+
+        if stream:
+            chunks = []
+            async for chunk in self.llm.generate_stream(
+                prompt, temperature=0.7, system_message=system_prompt,
+                conversation_context=conversation_context,
+            ):
+                print(chunk, end="", flush=True)
+                chunks.append(chunk)
+            print()
+            return "".join(chunks)
+
+        if conversation_context:
+            return await self.llm.generate_with_context(
                 prompt, conversation_context, temperature=0.7, system_message=system_prompt
             )
-        else:
-            response = await self.llm.generate(prompt, temperature=0.7)
-            
-        return response
+        return await self.llm.generate(prompt, temperature=0.7)
 
-    async def process_query(self, user_input):
-        """Process a user query through Hobbesian thought processes"""
+    async def process_query(self, user_input, stream=False, classify_task=None,
+                            sense_task=None):
+        """Process a user query through Hobbesian thought processes
+
+        stream=True prints the final synthesis as it is generated, for
+        interactive use; batch callers leave it off. classify_task and
+        sense_task let the caller pass already-running tasks for the
+        classification and sense stages, so those round trips started
+        before this coroutine did.
+        """
         results = {"original_input": user_input}
-        
-        # Store user input in conversation history
-        await self.memory.add_conversation_entry("user", user_input)
+
+        # Map-reduce digests: as each stage's output lands, a background
+        # task condenses it on the fast model while later stages run
+        summary_tasks = {}
+
+        def schedule_summary(stage):
+            summary_tasks[stage] = asyncio.create_task(
+                self._summarize_stage(results[stage])
+            )
 
         # Step 1: Sense perception (Chapter I)
-        # This is the foundation of all thought in Hobbes' system - raw sensory data
-        print("Processing sense perception...")
-        results["sense_data"] = await self.sense_agent.process(user_input)
-
-        # Step 2: Simple Imagination (Chapter II)
-        # Takes sense data and creates "decaying sense" - how information persists in memory
-        print("Processing simple imagination...")
-        results["simple_imagination"] = await self.simple_imagination_agent.process(
-            results["sense_data"], original_input=user_input
-        )
+        # This is the foundation of all thought in Hobbes' system - raw
+        # sensory data. It depends only on the raw input, so the call goes
+        # out before anything else in the pipeline runs.
+        if sense_task is None:
+            sense_task = asyncio.create_task(self.sense_agent.process(user_input))
 
-        # Step 3: Compound Imagination (Chapter II)
-        # Combines elements from different memories to create new mental constructs
-        print("Processing compound imagination...")
-        results["compound_imagination"] = await self.compound_imagination_agent.process(
-            results["simple_imagination"], original_input=user_input
-        )
+        # Store user input in conversation history
+        await self.memory.add_conversation_entry("user", user_input)
 
-        # Step 4a: Unguided Train of Thought (Chapter III)
-        # Free-flowing, associative thought without direction
-        print("Processing unguided train of thought...")
-        results["unguided_thought"] = await self.unguided_agent.process(
-            results["compound_imagination"]
-        )
+        try:
+            print("Processing sense perception...")
+            results["sense_data"] = await sense_task
+            schedule_summary("sense_data")
+
+            # Step 2: Simple Imagination (Chapter II)
+            # Takes sense data and creates "decaying sense" - how information persists in memory
+            print("Processing simple imagination...")
+            results["simple_imagination"] = await self.simple_imagination_agent.process(
+                results["sense_data"], original_input=user_input
+            )
+            schedule_summary("simple_imagination")
 
-        # Step 4b: Regulated Train of Thought (Chapter III)
-        # Goal-directed thought process aimed at achieving something specific
-        print("Extracting goal...")
-        goal = await self._extract_goal(user_input)
-        results["goal"] = goal
+            # Step 3: Compound Imagination (Chapter II)
+            # Combines elements from different memories to create new mental constructs
+            print("Processing compound imagination...")
+            results["compound_imagination"] = await self.compound_imagination_agent.process(
+                results["simple_imagination"], original_input=user_input
+            )
+            schedule_summary("compound_imagination")
+
+            # Steps 4-5 fan out concurrently: the fused goal/classifier call
+            # depends only on the user input, and unguided thought only on
+            # compound imagination, so their network latencies overlap instead
+            # of stacking. Only regulated thought (needs the goal) and the
+            # chosen analysis branch (needs the classification) wait, and both
+            # launch the moment the fused call lands.
+            print("Processing trains of thought...")
+            if classify_task is None:
+                classify_task = asyncio.create_task(self._classify_and_goal(user_input))
+            unguided_task = asyncio.create_task(
+                self.unguided_agent.process(results["compound_imagination"])
+            )
 
-        print("Processing regulated train of thought...")
-        results["regulated_thought"] = await self.regulated_agent.process(
-            results["compound_imagination"], goal
-        )
+            # Step 4b: Regulated Train of Thought (Chapter III)
+            # Goal-directed thought process aimed at achieving something specific
+            goal, should_seek_causes = await classify_task
+            results["goal"] = goal
+            regulated_task = asyncio.create_task(
+                self.regulated_agent.process(results["compound_imagination"], goal)
+            )
 
-        # Step 5: Causal/Effect Analysis (Chapter III)
-        # Determines whether to analyze causes or effects based on the query
-        should_seek_causes = await self._should_seek_causes(user_input)
+            # Step 5: Causal/Effect Analysis (Chapter III)
+            # Determines whether to analyze causes or effects based on the query
+            if should_seek_causes:
+                analysis_key = "causal_analysis"
+                analysis_task = asyncio.create_task(self.cause_agent.process(user_input))
+            else:
+                analysis_key = "effect_analysis"
+                analysis_task = asyncio.create_task(self.effect_agent.process(user_input))
+
+            # Step 4a: Unguided Train of Thought (Chapter III)
+            # Free-flowing, associative thought without direction
+            results["unguided_thought"] = await unguided_task
+            schedule_summary("unguided_thought")
+            results["regulated_thought"] = await regulated_task
+            schedule_summary("regulated_thought")
+            results[analysis_key] = await analysis_task
+            schedule_summary(analysis_key)
+
+            # Final synthesis - combines all thought processes into a cohesive response
+            print("Synthesizing final response...")
+            if stream:
+                print("\n=== FINAL RESPONSE ===")
+            # Collect the per-stage digests; a failed digest just means that
+            # stage falls back to its raw slice in the synthesis prompt
+            summaries = {}
+            for stage, task in summary_tasks.items():
+                try:
+                    summaries[stage] = (await task).strip()
+                except Exception:
+                    pass
+            results["final_response"] = await self._synthesize_response(
+                user_input, results, stream=stream, summaries=summaries
+            )
+        finally:
+            # If a stage raised before the digest collection ran, don't
+            # abandon the in-flight digest tasks un-awaited - same reaping
+            # the shell applies to its speculative tasks. On success all
+            # were consumed above and this is a no-op.
+            for task in summary_tasks.values():
+                if not task.done():
+                    task.cancel()
+                try:
+                    await task
+                except (Exception, asyncio.CancelledError):
+                    pass
 
-        if should_seek_causes:
-            print("Processing causal analysis...")
-            results["causal_analysis"] = await self.cause_agent.process(user_input)
-        else:
-            print("Processing effect analysis...")
-            results["effect_analysis"] = await self.effect_agent.process(user_input)
 
-        # Final synthesis - combines all thought processes into a cohesive response
-        print("Synthesizing final response...")
-        results["final_response"] = await self._synthesize_response(user_input, results)
-        
         # Store system response in conversation history
         await self.memory.add_conversation_entry("system", results["final_response"])
 
         return results
 
+    async def process_queries(self, inputs, max_concurrency=8):
+        """Process a list of queries concurrently, bounded by a semaphore
+
+        Used by the --batch mode for offline runs over a query corpus. The
+        cap keeps the fan-out from flooding the provider: each query already
+        spawns several concurrent LLM calls, so total in-flight requests is
+        roughly max_concurrency times the per-query fan-out. Results come
+        back in input order.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def one(query):
+            async with sem:
+                return await self.process_query(query)
+
+        return await asyncio.gather(*(one(q) for q in inputs))
+
+
+async def run_batch(mind, path):
+    """Run every query in a file through the mind and print results as JSONL
+
+    Accepts one query per line - either a JSON object with a "query" field
+    or a plain text line.
+    """
+    queries = []
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = line
+            if isinstance(record, dict):
+                queries.append(record.get("query") or record.get("prompt") or "")
+            else:
+                queries.append(str(record))
+
+    results = await mind.process_queries(queries)
+    for query, result in zip(queries, results):
+        print(json.dumps({"query": query, **result}))
+
 
 async def interactive_shell(mind):
     """Simple interactive shell for the Hobbesian mind with memory viewing"""
@@ -182,13 +443,19 @@ async def interactive_shell(mind):
     print("Type a query to process through Hobbes' model of cognition.")
     print("Special commands:")
     print("  memory           - List all memory buckets")
-    print("  memory <bucket>  - View memories in a specific bucket")
+    print("  memory <bucket> [page]  - View memories in a bucket, 20 per page")
     print("  conversation     - View conversation history")
     print("  clear            - Clear all memories and start fresh")
     print("  exit             - Exit the program")
 
+    session = PromptSession() if PromptSession is not None else None
+
     while True:
-        user_input = input("\nQuery > ")
+        if session is not None:
+            user_input = await session.prompt_async("\nQuery > ")
+        else:
+            # Keep the event loop free while the user types
+            user_input = await asyncio.to_thread(input, "\nQuery > ")
 
         # Handle special commands
         if user_input.lower() == "exit":
@@ -211,8 +478,8 @@ async def interactive_shell(mind):
                 print("\n=== Conversation History ===")
                 for i, entry in enumerate(conversation):
                     role = entry["role"].upper()
-                    content = entry["content"]
-                    print(f"\n{role}: {content[:200]}..." if len(content) > 200 else f"\n{role}: {content}")
+                    snippet = entry["content"][:201]
+                    print(f"\n{role}: {snippet[:200]}" + ("..." if len(snippet) == 201 else ""))
             continue
 
         elif user_input.lower().startswith("memory"):
@@ -222,39 +489,51 @@ async def interactive_shell(mind):
             if len(parts) == 1:
                 print("\nAvailable memory buckets:")
                 for bucket in mind.memory.buckets:
-                    count = len(mind.memory.buckets[bucket])
+                    # Counts come from the manager so listing doesn't force
+                    # every lazily-loaded bucket off disk
+                    count = mind.memory.get_bucket_count(bucket)
                     print(f"  {bucket} ({count} memories)")
 
-            # "memory <bucket>" command - show content of specific bucket
+            # "memory <bucket> [page]" command - show one page of a bucket
             elif len(parts) > 1:
                 bucket_name = parts[1]
+                page = 0
+                if len(parts) > 2 and parts[2].isdigit():
+                    page = max(0, int(parts[2]) - 1)
                 if bucket_name in mind.memory.buckets:
                     memories = mind.memory.buckets[bucket_name]
-                    if not memories:
+                    page_size = 20
+                    start = page * page_size
+                    total = len(memories)
+                    if not total:
                         print(f"\nNo memories in '{bucket_name}' bucket.")
+                    elif start >= total:
+                        print(f"\nNo page {page + 1} in '{bucket_name}' ({total} memories).")
                     else:
-                        print(f"\n=== Memories in '{bucket_name}' ===")
-                        for i, memory in enumerate(memories):
-                            print(f"\n--- Memory {i+1} ---")
-                            print(f"Timestamp: {memory['timestamp']}")
+                        print(f"\n=== Memories in '{bucket_name}' (page {page + 1}) ===")
+                        page_entries = islice(memories, start, start + page_size)
+                        for i, memory in enumerate(page_entries, start=start):
+                            print(f"\n--- Memory {i+1} of {total} ---")
+                            print(f"Timestamp: {format_timestamp(memory['timestamp'])}")
 
                             # Print metadata if it exists
                             if memory.get("metadata"):
                                 print("Metadata:")
                                 for key, value in memory["metadata"].items():
                                     print(f"  {key}: {value}")
-                                    
+
                             # Print role if it's a conversation entry
                             if "role" in memory:
                                 print(f"Role: {memory['role'].upper()}")
 
-                            # Print the actual content
+                            # Print the actual content. Slice first and check
+                            # the slice's length - never walk the full string
+                            # with len() just to decide whether to truncate.
                             print("\nContent:")
-                            print(
-                                memory["content"][:500] + "..."
-                                if len(memory["content"]) > 500
-                                else memory["content"]
-                            )
+                            snippet = memory["content"][:501]
+                            print(snippet[:500] + ("..." if len(snippet) == 501 else ""))
+                        if start + page_size < total:
+                            print(f"\n(Type 'memory {bucket_name} {page + 2}' for the next page.)")
                 else:
                     print(f"Bucket '{bucket_name}' does not exist.")
 
@@ -262,11 +541,33 @@ async def interactive_shell(mind):
 
         # Process normal query
         try:
-            print("\nProcessing your query through Hobbesian thought processes...")
-            results = await mind.process_query(user_input)
+            # Fire the sense and goal/classification calls the moment the
+            # user hits enter - both only need the raw input, so their
+            # round trips overlap the pipeline's setup and early stages
+            sense_task = asyncio.create_task(mind.sense_agent.process(user_input))
+            classify_task = asyncio.create_task(mind._classify_and_goal(user_input))
+
+            try:
+                print("\nProcessing your query through Hobbesian thought processes...")
+                # The final response streams to the terminal as it is generated
+                await mind.process_query(
+                    user_input, stream=True,
+                    classify_task=classify_task, sense_task=sense_task,
+                )
+            finally:
+                # If the pipeline raised before consuming the speculative
+                # tasks, don't abandon them un-awaited: an orphaned task
+                # logs "Task exception was never retrieved" later and its
+                # in-flight LLM call keeps burning tokens. On success both
+                # are already done and this is a no-op.
+                for task in (sense_task, classify_task):
+                    if not task.done():
+                        task.cancel()
+                    try:
+                        await task
+                    except (Exception, asyncio.CancelledError):
+                        pass
 
-            print("\n=== FINAL RESPONSE ===")
-            print(results["final_response"])
             print("\nType 'memory' to view the memories created during this process.")
             print("Type 'conversation' to view the conversation history.")
 
@@ -276,8 +577,28 @@ async def interactive_shell(mind):
 
 async def main():
     mind = HobbesianMind(model="deepseek-chat")
-    await interactive_shell(mind)
+    try:
+        # `python main.py --batch queries.jsonl` runs non-interactively over
+        # a file of queries; the default remains the interactive shell
+        if len(sys.argv) > 2 and sys.argv[1] == "--batch":
+            await run_batch(mind, sys.argv[2])
+        else:
+            await interactive_shell(mind)
+    finally:
+        # Flush buffered memory writes, then close the shared HTTP pool
+        await mind.memory.close()
+        await aclose_clients()
 
 
 if __name__ == "__main__":
+    # Use uvloop's libuv-backed event loop when available - roughly 2x
+    # faster than the default loop on I/O-heavy workloads like our
+    # fan-out of concurrent LLM calls. Optional so Windows and minimal
+    # installs still run on the stdlib loop.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())